@@ -1,8 +1,10 @@
+import os
 from pathlib import Path
 
 import dask.array as da
 import numpy as np
 from distributed import Client, LocalCluster
+from scipy.sparse import csr_matrix
 from sklearn.datasets import load_svmlight_file
 
 import lightgbm as lgb
@@ -16,41 +18,71 @@ if __name__ == "__main__":
 
     print("initializing a Dask cluster")
 
-    cluster = LocalCluster(n_workers=2)
+    # lightgbm.dask sets num_threads for each LightGBM process to the number of threads of
+    # its Dask worker, so split the cores evenly between worker processes to avoid oversubscription
+    n_workers = 2
+    cluster = LocalCluster(
+        n_workers=n_workers,
+        threads_per_worker=max(1, (os.cpu_count() or n_workers) // n_workers),
+        processes=True
+    )
     client = Client(cluster)
 
     print("created a Dask LocalCluster")
 
     print("distributing training data on the Dask cluster")
 
-    # split training data into two partitions
-    rows_in_part1 = int(np.sum(group[:100]))
-    rows_in_part2 = X.shape[0] - rows_in_part1
-    num_features = X.shape[1]
-
-    # make this array dense because we're splitting across
-    # a sparse boundary to partition the data
-    X = X.toarray()
-
-    dX = da.from_array(
-        x=X,
-        chunks=[
-            (rows_in_part1, rows_in_part2),
-            (num_features,)
-        ]
-    )
-    dy = da.from_array(
-        x=y,
-        chunks=[
-            (rows_in_part1, rows_in_part2),
-        ]
-    )
-    dg = da.from_array(
-        x=group,
-        chunks=[
-            (100, group.size - 100)
-        ]
-    )
+    # split training data into partitions of roughly 100MB of features each (but
+    # at least one partition per worker), without splitting any query group
+    # across partitions
+    num_rows, num_features = X.shape
+    bytes_per_row = num_features * X.dtype.itemsize
+    target_rows = min(max(1, 100_000_000 // bytes_per_row), -(-num_rows // n_workers))
+
+    row_sizes = []
+    group_sizes = []
+    rows_in_part = 0
+    groups_in_part = 0
+    for group_size in group.astype(int):
+        rows_in_part += group_size
+        groups_in_part += 1
+        if rows_in_part >= target_rows:
+            row_sizes.append(rows_in_part)
+            group_sizes.append(groups_in_part)
+            rows_in_part = 0
+            groups_in_part = 0
+    if groups_in_part > 0:
+        row_sizes.append(rows_in_part)
+        group_sizes.append(groups_in_part)
+
+    # scatter each partition directly to a worker instead of embedding the training
+    # data in the task graph, and keep X sparse instead of densifying the whole
+    # matrix just to split it
+    worker_addresses = list(client.scheduler_info()["workers"])
+    row_offsets = np.cumsum([0] + row_sizes)
+    group_offsets = np.cumsum([0] + group_sizes)
+    X_parts = []
+    y_parts = []
+    group_parts = []
+    for i in range(len(row_sizes)):
+        row_start, row_stop = row_offsets[i], row_offsets[i + 1]
+        group_start, group_stop = group_offsets[i], group_offsets[i + 1]
+        X_part, y_part, group_part = client.scatter(
+            [X[row_start:row_stop].tocsr(), y[row_start:row_stop], group[group_start:group_stop]],
+            workers=[worker_addresses[i % len(worker_addresses)]],
+            hash=False
+        )
+        X_parts.append(da.from_delayed(
+            X_part,
+            shape=(row_sizes[i], num_features),
+            meta=csr_matrix((0, num_features), dtype=X.dtype)
+        ))
+        y_parts.append(da.from_delayed(y_part, shape=(row_sizes[i],), dtype=y.dtype))
+        group_parts.append(da.from_delayed(group_part, shape=(group_sizes[i],), dtype=group.dtype))
+
+    dX = da.concatenate(X_parts, axis=0)
+    dy = da.concatenate(y_parts)
+    dg = da.concatenate(group_parts)
 
     print("beginning training")
 
@@ -6,8 +6,13 @@ with list of all parameters, aliases table and other routines
 along with parameters description in LightGBM/docs/Parameters.rst file
 from the information in LightGBM/include/LightGBM/config.h file.
 """
+from itertools import chain
 from pathlib import Path
 
+_UNIVAR_MAPPER = {"int": "GetInt", "double": "GetDouble", "bool": "GetBool", "std::string": "GetString"}
+_CHECK_MAPPER = {"<": "LT", ">": "GT", "<=": "LE", ">=": "GE"}
+_VECTOR_PREFIX = "std::vector<"
+
 
 def get_parameter_infos(config_hpp):
     """Parse config header file.
@@ -61,13 +66,11 @@ def get_parameter_infos(config_hpp):
                     else:
                         cur_info[key].append(val)
                 elif line:
-                    has_eqsgn = False
-                    tokens = line.split("=")
-                    if len(tokens) == 2:
-                        if "default" not in cur_info:
-                            cur_info["default"] = [tokens[1][:-1].strip()]
-                        has_eqsgn = True
-                    tokens = line.split()
+                    declaration, eqsgn, default = line.partition("=")
+                    has_eqsgn = bool(eqsgn)
+                    if has_eqsgn and "default" not in cur_info:
+                        cur_info["default"] = [default[:-1].strip()]
+                    tokens = declaration.split()
                     cur_info["inner_type"] = [tokens[0].strip()]
                     if "name" not in cur_info:
                         if has_eqsgn:
@@ -92,11 +95,7 @@ def get_names(infos):
     names : list
         Names of all parameters.
     """
-    names = []
-    for x in infos:
-        for y in x:
-            names.append(y["name"][0])
-    return names
+    return [y["name"][0] for y in chain.from_iterable(infos)]
 
 
 def get_alias(infos):
@@ -112,15 +111,12 @@ def get_alias(infos):
     pairs : list
         List of tuples (param alias, param name).
     """
-    pairs = []
-    for x in infos:
-        for y in x:
-            if "alias" in y:
-                name = y["name"][0]
-                alias = y["alias"][0].split(',')
-                for name2 in alias:
-                    pairs.append((name2.strip(), name))
-    return pairs
+    return [
+        (alias.strip(), y["name"][0])
+        for y in chain.from_iterable(infos)
+        if "alias" in y
+        for alias in y["alias"][0].split(',')
+    ]
 
 
 def parse_check(check, reverse=False):
@@ -168,25 +164,21 @@ def set_one_var_from_string(name, param_type, checks):
     ret : string
         Lines of auto config file with getting and checks of one parameter value.
     """
-    ret = ""
-    univar_mapper = {"int": "GetInt", "double": "GetDouble", "bool": "GetBool", "std::string": "GetString"}
-    if "vector" not in param_type:
-        ret += f'  {univar_mapper[param_type]}(params, "{name}", &{name});\n'
-        if len(checks) > 0:
-            check_mapper = {"<": "LT", ">": "GT", "<=": "LE", ">=": "GE"}
-            for check in checks:
-                value, sign = parse_check(check)
-                ret += f"  CHECK_{check_mapper[sign]}({name}, {value});\n"
-        ret += "\n"
-    else:
-        ret += f'  if (GetString(params, "{name}", &tmp_str)) {{\n'
-        type2 = param_type.split("<")[1][:-1]
+    ret = []
+    if param_type.startswith(_VECTOR_PREFIX):
+        ret.append(f'  if (GetString(params, "{name}", &tmp_str)) {{\n')
+        type2 = param_type[len(_VECTOR_PREFIX):-1]
         if type2 == "std::string":
-            ret += f"    {name} = Common::Split(tmp_str.c_str(), ',');\n"
+            ret.append(f"    {name} = Common::Split(tmp_str.c_str(), ',');\n")
         else:
-            ret += f"    {name} = Common::StringToArray<{type2}>(tmp_str, ',');\n"
-        ret += "  }\n\n"
-    return ret
+            ret.append(f"    {name} = Common::StringToArray<{type2}>(tmp_str, ',');\n")
+        ret.append("  }\n")
+    else:
+        ret.append(f'  {_UNIVAR_MAPPER[param_type]}(params, "{name}", &{name});\n')
+        for check in checks:
+            value, sign = parse_check(check)
+            ret.append(f"  CHECK_{_CHECK_MAPPER[sign]}({name}, {value});\n")
+    return "".join(ret)
 
 
 def gen_parameter_description(sections, descriptions, params_rst):
@@ -254,6 +246,8 @@ def gen_parameter_description(sections, descriptions, params_rst):
 def gen_parameter_code(config_hpp, config_out_cpp):
     """Generate auto config file.
 
+    The auto config file is not rewritten if it is newer than the config header file.
+
     Parameters
     ----------
     config_hpp : pathlib.Path
@@ -267,73 +261,81 @@ def gen_parameter_code(config_hpp, config_out_cpp):
         Tuple with names and content of sections.
     """
     keys, infos = get_parameter_infos(config_hpp)
+    try:
+        if config_out_cpp.stat().st_mtime >= config_hpp.stat().st_mtime:
+            return keys, infos
+    except OSError:
+        pass
     names = get_names(infos)
     alias = get_alias(infos)
-    str_to_write = r"""/*!
+    with open(config_out_cpp, "w", buffering=1 << 20) as config_out_cpp_file:
+        write = config_out_cpp_file.write
+        write(r"""/*!
  * Copyright (c) 2018 Microsoft Corporation. All rights reserved.
  * Licensed under the MIT License. See LICENSE file in the project root for license information.
  *
  * \note
  * This file is auto generated by LightGBM\helpers\parameter_generator.py from LightGBM\include\LightGBM\config.h file.
  */
-"""
-    str_to_write += "#include<LightGBM/config.h>\nnamespace LightGBM {\n"
-    # alias table
-    str_to_write += "const std::unordered_map<std::string, std::string>& Config::alias_table() {\n"
-    str_to_write += "  static std::unordered_map<std::string, std::string> aliases({\n"
-
-    for pair in alias:
-        str_to_write += f'  {{"{pair[0]}", "{pair[1]}"}},\n'
-    str_to_write += "  });\n"
-    str_to_write += "  return aliases;\n"
-    str_to_write += "}\n\n"
-
-    # names
-    str_to_write += "const std::unordered_set<std::string>& Config::parameter_set() {\n"
-    str_to_write += "  static std::unordered_set<std::string> params({\n"
-
-    for name in names:
-        str_to_write += f'  "{name}",\n'
-    str_to_write += "  });\n"
-    str_to_write += "  return params;\n"
-    str_to_write += "}\n\n"
-    # from strings
-    str_to_write += "void Config::GetMembersFromString(const std::unordered_map<std::string, std::string>& params) {\n"
-    str_to_write += '  std::string tmp_str = "";\n'
-    for x in infos:
-        for y in x:
-            if "[doc-only]" in y:
-                continue
-            param_type = y["inner_type"][0]
-            name = y["name"][0]
-            checks = []
-            if "check" in y:
-                checks = y["check"]
-            tmp = set_one_var_from_string(name, param_type, checks)
-            str_to_write += tmp
-    # tails
-    str_to_write = f"{str_to_write.strip()}\n}}\n\n"
-    str_to_write += "std::string Config::SaveMembersToString() const {\n"
-    str_to_write += "  std::stringstream str_buf;\n"
-    for x in infos:
-        for y in x:
-            if "[doc-only]" in y or "[no-save]" in y:
-                continue
-            param_type = y["inner_type"][0]
-            name = y["name"][0]
-            if "vector" in param_type:
-                if "int8" in param_type:
-                    str_to_write += f'  str_buf << "[{name}: " << Common::Join(Common::ArrayCast<int8_t, int>({name}), ",") << "]\\n";\n'
+""")
+        write("#include<LightGBM/config.h>\nnamespace LightGBM {\n")
+        # alias table
+        write("const std::unordered_map<std::string, std::string>& Config::alias_table() {\n")
+        write("  static std::unordered_map<std::string, std::string> aliases({\n")
+
+        for pair in alias:
+            write(f'  {{"{pair[0]}", "{pair[1]}"}},\n')
+        write("  });\n")
+        write("  return aliases;\n")
+        write("}\n\n")
+
+        # names
+        write("const std::unordered_set<std::string>& Config::parameter_set() {\n")
+        write("  static std::unordered_set<std::string> params({\n")
+
+        for name in names:
+            write(f'  "{name}",\n')
+        write("  });\n")
+        write("  return params;\n")
+        write("}\n\n")
+        # from strings
+        write("void Config::GetMembersFromString(const std::unordered_map<std::string, std::string>& params) {\n")
+        write('  std::string tmp_str = "";\n')
+        # blocks of different parameters are separated by an empty line
+        separator = ""
+        for x in infos:
+            for y in x:
+                if "[doc-only]" in y:
+                    continue
+                param_type = y["inner_type"][0]
+                name = y["name"][0]
+                checks = []
+                if "check" in y:
+                    checks = y["check"]
+                write(separator)
+                write(set_one_var_from_string(name, param_type, checks))
+                separator = "\n"
+        # tails
+        write("}\n\n")
+        write("std::string Config::SaveMembersToString() const {\n")
+        write("  std::stringstream str_buf;\n")
+        for x in infos:
+            for y in x:
+                if "[doc-only]" in y or "[no-save]" in y:
+                    continue
+                param_type = y["inner_type"][0]
+                name = y["name"][0]
+                if "vector" in param_type:
+                    if "int8" in param_type:
+                        write(f'  str_buf << "[{name}: " << Common::Join(Common::ArrayCast<int8_t, int>({name}), ",") << "]\\n";\n')
+                    else:
+                        write(f'  str_buf << "[{name}: " << Common::Join({name}, ",") << "]\\n";\n')
                 else:
-                    str_to_write += f'  str_buf << "[{name}: " << Common::Join({name}, ",") << "]\\n";\n'
-            else:
-                str_to_write += f'  str_buf << "[{name}: " << {name} << "]\\n";\n'
-    # tails
-    str_to_write += "  return str_buf.str();\n"
-    str_to_write += "}\n\n"
-    str_to_write += "}  // namespace LightGBM\n"
-    with open(config_out_cpp, "w") as config_out_cpp_file:
-        config_out_cpp_file.write(str_to_write)
+                    write(f'  str_buf << "[{name}: " << {name} << "]\\n";\n')
+        # tails
+        write("  return str_buf.str();\n")
+        write("}\n\n")
+        write("}  // namespace LightGBM\n")
 
     return keys, infos
 
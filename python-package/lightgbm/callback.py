@@ -1,8 +1,10 @@
 # coding: utf-8
 """Callbacks library."""
 import collections
-from operator import gt, lt
-from typing import Any, Callable, Dict, List, Union
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+import numpy as np
 
 from .basic import _ConfigAliases, _log_info, _log_warning
 
@@ -36,17 +38,30 @@ CallbackEnv = collections.namedtuple(
      "evaluation_result_list"])
 
 
+def _format_eval_result_without_stdv(value: list) -> str:
+    return f"{value[0]}'s {value[1]}: {value[2]:g}"
+
+
+def _format_eval_result_with_stdv(value: list) -> str:
+    return f"{value[0]}'s {value[1]}: {value[2]:g} + {value[4]:g}"
+
+
+# formatters of evaluation results, keyed by (length of the result, whether to show stdv)
+_EVAL_RESULT_FORMATTERS: Dict[Tuple[int, bool], Callable[[list], str]] = {
+    (4, False): _format_eval_result_without_stdv,
+    (4, True): _format_eval_result_without_stdv,
+    (5, False): _format_eval_result_without_stdv,
+    (5, True): _format_eval_result_with_stdv,
+}
+
+
 def _format_eval_result(value: list, show_stdv: bool = True) -> str:
     """Format metric string."""
-    if len(value) == 4:
-        return f"{value[0]}'s {value[1]}: {value[2]:g}"
-    elif len(value) == 5:
-        if show_stdv:
-            return f"{value[0]}'s {value[1]}: {value[2]:g} + {value[4]:g}"
-        else:
-            return f"{value[0]}'s {value[1]}: {value[2]:g}"
-    else:
-        raise ValueError("Wrong metric value")
+    try:
+        formatter = _EVAL_RESULT_FORMATTERS[len(value), bool(show_stdv)]
+    except KeyError:
+        raise ValueError("Wrong metric value") from None
+    return formatter(value)
 
 
 def print_evaluation(period: int = 1, show_stdv: bool = True) -> Callable:
@@ -64,8 +79,13 @@ def print_evaluation(period: int = 1, show_stdv: bool = True) -> Callable:
     callback : function
         The callback that prints the evaluation results every ``period`` iteration(s).
     """
-    def _callback(env: CallbackEnv) -> None:
-        if period > 0 and env.evaluation_result_list and (env.iteration + 1) % period == 0:
+    if period <= 0:
+        def _callback(env: CallbackEnv) -> None:
+            pass
+    else:
+        def _callback(env: CallbackEnv) -> None:
+            if (env.iteration + 1) % period or not env.evaluation_result_list:
+                return
             result = '\t'.join([_format_eval_result(x, show_stdv) for x in env.evaluation_result_list])
             _log_info(f'[{env.iteration + 1}]\t{result}')
     _callback.order = 10  # type: ignore
@@ -124,15 +144,22 @@ def reset_parameter(**kwargs: Union[list, Callable]) -> Callable:
     callback : function
         The callback that resets the parameter after the first iteration.
     """
+    # resolve every parameter to a function of the current round once
+    schedules: List[Tuple[str, Callable[[int], Any]]] = [
+        (key, value.__getitem__ if isinstance(value, list) else value)
+        for key, value in kwargs.items()
+    ]
+    list_params = [(key, value) for key, value in kwargs.items() if isinstance(value, list)]
+
     def _callback(env: CallbackEnv) -> None:
+        num_rounds = env.end_iteration - env.begin_iteration
+        for key, value in list_params:
+            if len(value) != num_rounds:
+                raise ValueError(f"Length of list {key!r} has to equal to 'num_boost_round'.")
+        current_round = env.iteration - env.begin_iteration
         new_parameters = {}
-        for key, value in kwargs.items():
-            if isinstance(value, list):
-                if len(value) != env.end_iteration - env.begin_iteration:
-                    raise ValueError(f"Length of list {key!r} has to equal to 'num_boost_round'.")
-                new_param = value[env.iteration - env.begin_iteration]
-            else:
-                new_param = value(env.iteration - env.begin_iteration)
+        for key, schedule in schedules:
+            new_param = schedule(current_round)
             if new_param != env.params.get(key, None):
                 new_parameters[key] = new_param
         if new_parameters:
@@ -143,6 +170,25 @@ def reset_parameter(**kwargs: Union[list, Callable]) -> Callable:
     return _callback
 
 
+class _EarlyStopState:
+    """State of the early stopping callback, shared by its inner functions."""
+
+    __slots__ = ('initialized', 'enabled', 'first_metric', 'higher_better', 'best_score', 'best_iter',
+                 'best_score_list', 'check_stopping')
+
+    def __init__(self) -> None:
+        self.initialized = False
+        self.enabled = True
+        self.first_metric = ''
+        self.higher_better = np.zeros(0, dtype=np.bool_)
+        self.best_score = np.zeros(0, dtype=np.float64)
+        self.best_iter = np.zeros(0, dtype=np.int64)
+        self.best_score_list: list = []
+        # whether each evaluation result can trigger early stopping
+        # (not computed on training data, and not skipped by first_metric_only)
+        self.check_stopping = np.zeros(0, dtype=np.bool_)
+
+
 def early_stopping(stopping_rounds: int, first_metric_only: bool = False, verbose: bool = True) -> Callable:
     """Create a callback that activates early stopping.
 
@@ -168,18 +214,14 @@ def early_stopping(stopping_rounds: int, first_metric_only: bool = False, verbos
     callback : function
         The callback that activates early stopping.
     """
-    best_score = []
-    best_iter = []
-    best_score_list: list = []
-    cmp_op = []
-    enabled = [True]
-    first_metric = ['']
+    state = _EarlyStopState()
 
     def _init(env: CallbackEnv) -> None:
-        enabled[0] = not any(env.params.get(boost_alias, "") == 'dart' for boost_alias
-                             in _ConfigAliases.get("boosting"))
-        if not enabled[0]:
+        state.enabled = not any(env.params.get(boost_alias, "") == 'dart' for boost_alias
+                                in _ConfigAliases.get("boosting"))
+        if not state.enabled:
             _log_warning('Early stopping is not available in dart mode')
+            state.initialized = True
             return
         if not env.evaluation_result_list:
             raise ValueError('For early stopping, '
@@ -188,54 +230,59 @@ def early_stopping(stopping_rounds: int, first_metric_only: bool = False, verbos
         if verbose:
             _log_info(f"Training until validation scores don't improve for {stopping_rounds} rounds")
 
-        # split is needed for "<dataset type> <metric>" case (e.g. "train l1")
-        first_metric[0] = env.evaluation_result_list[0][1].split(" ")[-1]
+        state.first_metric = env.evaluation_result_list[0][1].split(" ")[-1]
+        n_results = len(env.evaluation_result_list)
+        state.higher_better = np.array([eval_ret[3] for eval_ret in env.evaluation_result_list], dtype=np.bool_)
+        state.best_score = np.where(state.higher_better, -np.inf, np.inf)
+        state.best_iter = np.zeros(n_results, dtype=np.int64)
+        state.best_score_list = [None] * n_results
+        is_train = []
+        skip = []
         for eval_ret in env.evaluation_result_list:
-            best_iter.append(0)
-            best_score_list.append(None)
-            if eval_ret[3]:
-                best_score.append(float('-inf'))
-                cmp_op.append(gt)
-            else:
-                best_score.append(float('inf'))
-                cmp_op.append(lt)
-
-    def _final_iteration_check(env: CallbackEnv, eval_name_splitted: List[str], i: int) -> None:
-        if env.iteration == env.end_iteration - 1:
-            if verbose:
-                best_score_str = '\t'.join([_format_eval_result(x) for x in best_score_list[i]])
-                _log_info('Did not meet early stopping. '
-                          f'Best iteration is:\n[{best_iter[i] + 1}]\t{best_score_str}')
-                if first_metric_only:
-                    _log_info(f"Evaluated only: {eval_name_splitted[-1]}")
-            raise EarlyStopException(best_iter[i], best_score_list[i])
+            # split is needed for "<dataset type> <metric>" case (e.g. "train l1")
+            eval_name_splitted = eval_ret[1].split(" ")
+            skip.append(first_metric_only and state.first_metric != eval_name_splitted[-1])
+            # train data for lgb.cv or sklearn wrapper (underlying lgb.train)
+            is_train.append(eval_ret[0] == "cv_agg" and eval_name_splitted[0] == "train"
+                            or eval_ret[0] == env.model._train_data_name)
+        state.check_stopping = ~(np.array(is_train, dtype=np.bool_) | np.array(skip, dtype=np.bool_))
+        state.initialized = True
+
+    def _stop(i: int, message: str) -> None:
+        best_iter = int(state.best_iter[i])
+        if verbose:
+            best_score_str = '\t'.join([_format_eval_result(x) for x in state.best_score_list[i]])
+            _log_info(f"{message}\n[{best_iter + 1}]\t{best_score_str}")
+            if first_metric_only:
+                _log_info(f"Evaluated only: {state.first_metric}")
+        raise EarlyStopException(best_iter, state.best_score_list[i])
 
     def _callback(env: CallbackEnv) -> None:
-        if not cmp_op:
+        if not state.initialized:
             _init(env)
-        if not enabled[0]:
+        if not state.enabled:
             return
-        for i in range(len(env.evaluation_result_list)):
-            score = env.evaluation_result_list[i][2]
-            if best_score_list[i] is None or cmp_op[i](score, best_score[i]):
-                best_score[i] = score
-                best_iter[i] = env.iteration
-                best_score_list[i] = env.evaluation_result_list
-            # split is needed for "<dataset type> <metric>" case (e.g. "train l1")
-            eval_name_splitted = env.evaluation_result_list[i][1].split(" ")
-            if first_metric_only and first_metric[0] != eval_name_splitted[-1]:
-                continue  # use only the first metric for early stopping
-            if ((env.evaluation_result_list[i][0] == "cv_agg" and eval_name_splitted[0] == "train"
-                 or env.evaluation_result_list[i][0] == env.model._train_data_name)):
-                _final_iteration_check(env, eval_name_splitted, i)
-                continue  # train data for lgb.cv or sklearn wrapper (underlying lgb.train)
-            elif env.iteration - best_iter[i] >= stopping_rounds:
-                if verbose:
-                    eval_result_str = '\t'.join([_format_eval_result(x) for x in best_score_list[i]])
-                    _log_info(f"Early stopping, best iteration is:\n[{best_iter[i] + 1}]\t{eval_result_str}")
-                    if first_metric_only:
-                        _log_info(f"Evaluated only: {eval_name_splitted[-1]}")
-                raise EarlyStopException(best_iter[i], best_score_list[i])
-            _final_iteration_check(env, eval_name_splitted, i)
+        scores = np.fromiter(map(itemgetter(2), env.evaluation_result_list),
+                             dtype=np.float64, count=len(state.best_score))
+        if state.best_score_list[0] is None:
+            improved = np.ones(len(scores), dtype=np.bool_)
+        else:
+            improved = np.where(state.higher_better, scores > state.best_score, scores < state.best_score)
+        if improved.any():
+            state.best_score[improved] = scores[improved]
+            state.best_iter[improved] = env.iteration
+            # keep a snapshot, so later changes to the evaluation results list do not alter the best scores
+            best_score_list = list(env.evaluation_result_list)
+            for i in np.flatnonzero(improved):
+                state.best_score_list[i] = best_score_list
+        should_stop = state.check_stopping & (env.iteration - state.best_iter >= stopping_rounds)
+        # the first evaluation result is never skipped by first_metric_only,
+        # so it is the one which is reported after the final iteration
+        if env.iteration == env.end_iteration - 1:
+            if should_stop[0]:
+                _stop(0, "Early stopping, best iteration is:")
+            _stop(0, "Did not meet early stopping. Best iteration is:")
+        elif should_stop.any():
+            _stop(int(np.flatnonzero(should_stop)[0]), "Early stopping, best iteration is:")
     _callback.order = 30  # type: ignore
     return _callback